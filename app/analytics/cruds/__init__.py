@@ -1,5 +1,11 @@
 from .analytics import get_analytics
+from .views import flush_pending_refresh, mark_stale, refresh_analytics_views, schedule_refresh, views_generation
 
 __all__ = [
+	"flush_pending_refresh",
 	"get_analytics",
+	"mark_stale",
+	"refresh_analytics_views",
+	"schedule_refresh",
+	"views_generation",
 ]
@@ -1,105 +1,66 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.evaluation.models.evaluation import Evaluation
+from sqlalchemy import Float, Numeric, cast, func, select
+from app.analytics.models.views import EvalModelComparisonMV, EvalScatterMV
 
 
-def get_analytics(db: Session):
-    """Aggregate metrics for chart-friendly analytics payloads."""
-    scatter_data = db.query(
-        Evaluation.model,
-        Evaluation.temperature,
-        Evaluation.top_p,
-        func.avg(Evaluation.lexical_diversity).label("avg_lexical_diversity"),
-        func.avg(Evaluation.query_coverage).label("avg_query_coverage"),
-        func.avg(Evaluation.flesch_kincaid_grade).label("avg_fk_grade"),
-        func.avg(Evaluation.repetition_penalty).label("avg_repetition_penalty"),
-        func.count(Evaluation.id).label("run_count"),
-    ).group_by(
-        Evaluation.model,
-        Evaluation.temperature,
-        Evaluation.top_p,
-    ).all()
+def _round2(expr):
+    """Round a float expression to 2 decimals portably (Postgres lacks round(float, int))."""
+    return cast(func.round(cast(expr, Numeric), 2), Float)
+
 
-    model_comparison = db.query(
-        Evaluation.model,
-        func.avg(Evaluation.lexical_diversity).label("avg_lexical_diversity"),
-        func.avg(Evaluation.query_coverage).label("avg_query_coverage"),
-        func.avg(Evaluation.flesch_kincaid_grade).label("avg_fk_grade"),
-        func.avg(Evaluation.repetition_penalty).label("avg_repetition_penalty"),
-    ).group_by(Evaluation.model).all()
+def _normalized(sq):
+    """Wrap an aggregated view with dataset-aware normalization columns.
 
-    overall = db.query(
-        func.avg(Evaluation.lexical_diversity),
-        func.avg(Evaluation.query_coverage),
-        func.avg(Evaluation.flesch_kincaid_grade),
-        func.avg(Evaluation.repetition_penalty),
-    ).one()
-    # Convert to dicts for manipulation
-    scatter = [dict(row._mapping) for row in scatter_data]
-    compare = [dict(row._mapping) for row in model_comparison]
+    Percent metrics pass through; FK grade is min-max normalized (higher is
+    better) and repetition is min-max normalized and inverted. Min/max come
+    from window functions over the whole aggregated set, so the database
+    returns ready-to-serve rows in one pass.
+    """
+    fk_min = func.min(sq.c.avg_fk_grade).over()
+    fk_max = func.max(sq.c.avg_fk_grade).over()
+    rp_min = func.min(sq.c.avg_repetition_penalty).over()
+    rp_max = func.max(sq.c.avg_repetition_penalty).over()
 
-    # Dataset-aware normalization (min-max per returned set)
-    def _min_max(vals):
-        vals = [v for v in vals if v is not None]
-        if not vals:
-            return (0.0, 0.0)
-        return (min(vals), max(vals))
+    norm_fk = 100.0 * (sq.c.avg_fk_grade - fk_min) / func.nullif(fk_max - fk_min, 0)
+    norm_rp = 100.0 * (rp_max - sq.c.avg_repetition_penalty) / func.nullif(rp_max - rp_min, 0)
 
-    def _norm_high_is_better(x, vmin, vmax):
-        rng = (vmax - vmin) if (vmax - vmin) != 0 else 1e-9
-        return 100.0 * (x - vmin) / rng
+    return select(
+        *sq.c,
+        _round2(sq.c.avg_lexical_diversity).label("norm_lexical_diversity"),
+        _round2(sq.c.avg_query_coverage).label("norm_query_coverage"),
+        func.coalesce(_round2(norm_fk), 0.0).label("norm_fk_grade"),
+        func.coalesce(_round2(norm_rp), 0.0).label("norm_repetition_penalty"),
+    )
 
-    def _norm_low_is_better(x, vmin, vmax):
-        rng = (vmax - vmin) if (vmax - vmin) != 0 else 1e-9
-        return 100.0 * (vmax - x) / rng
 
-    # Scatter normalization based on aggregated rows
-    if scatter:
-        ld_vals = [row["avg_lexical_diversity"] for row in scatter]
-        qc_vals = [row["avg_query_coverage"] for row in scatter]
-        fk_vals = [row["avg_fk_grade"] for row in scatter]
-        rp_vals = [row["avg_repetition_penalty"] for row in scatter]
+# Built once at import so each request reuses the same statement objects (and their cached compiled SQL)
+SCATTER_STMT = _normalized(EvalScatterMV.__table__)
+COMPARISON_STMT = _normalized(EvalModelComparisonMV.__table__)
 
-        # For percent metrics already in 0..100, do not normalize (pass through)
-        # Keep normalization only for FK grade and repetition.
-        ld_min, ld_max = _min_max(ld_vals)
-        qc_min, qc_max = _min_max(qc_vals)
-        fk_min, fk_max = _min_max(fk_vals)
-        rp_min, rp_max = _min_max(rp_vals)
 
-        for row in scatter:
-            # Pass-through for percent metrics
-            row["norm_lexical_diversity"] = round(row["avg_lexical_diversity"], 2)
-            row["norm_query_coverage"] = round(row["avg_query_coverage"], 2)
-            row["norm_fk_grade"] = round(_norm_high_is_better(row["avg_fk_grade"], fk_min, fk_max), 2)
-            row["norm_repetition_penalty"] = round(_norm_low_is_better(row["avg_repetition_penalty"], rp_min, rp_max), 2)
+def get_analytics(db: Session):
+    """Aggregate metrics for chart-friendly analytics payloads.
 
-    # Model comparison normalization separately on that set
-    if compare:
-        ld_vals = [row["avg_lexical_diversity"] for row in compare]
-        qc_vals = [row["avg_query_coverage"] for row in compare]
-        fk_vals = [row["avg_fk_grade"] for row in compare]
-        rp_vals = [row["avg_repetition_penalty"] for row in compare]
+    Per-group averages are read from the pre-aggregated analytics views
+    instead of re-scanning all evaluations on every request.
+    """
+    scatter = db.execute(SCATTER_STMT).mappings().all()
+    compare = db.execute(COMPARISON_STMT).mappings().all()
 
-        # Skip normalization for percent metrics
-        ld_min, ld_max = _min_max(ld_vals)
-        qc_min, qc_max = _min_max(qc_vals)
-        fk_min, fk_max = _min_max(fk_vals)
-        rp_min, rp_max = _min_max(rp_vals)
+    # Overall averages are run_count-weighted means of the scatter groups: no third query
+    # An empty dataset has no rows, so every weighted sum is 0 and the KPI is 0.0
+    total_runs = sum(row["run_count"] for row in scatter) or 1
 
-        for row in compare:
-            row["norm_lexical_diversity"] = round(row["avg_lexical_diversity"], 2)
-            row["norm_query_coverage"] = round(row["avg_query_coverage"], 2)
-            row["norm_fk_grade"] = round(_norm_high_is_better(row["avg_fk_grade"], fk_min, fk_max), 2)
-            row["norm_repetition_penalty"] = round(_norm_low_is_better(row["avg_repetition_penalty"], rp_min, rp_max), 2)
+    def _overall(key: str) -> float:
+        return round(sum(row[key] * row["run_count"] for row in scatter) / total_runs, 2)
 
     return {
         "scatter_data": scatter,
         "model_comparison": compare,
         "kpi": {
-            "overall_avg_lexical_diversity": round(overall[0], 2) if overall[0] else 0,
-            "overall_avg_query_coverage": round(overall[1], 2) if overall[1] else 0,
-            "overall_avg_fk_grade": round(overall[2], 2) if overall[2] else 0,
-            "overall_avg_repetition_penalty": round(overall[3], 2) if overall[3] else 0,
+            "overall_avg_lexical_diversity": _overall("avg_lexical_diversity"),
+            "overall_avg_query_coverage": _overall("avg_query_coverage"),
+            "overall_avg_fk_grade": _overall("avg_fk_grade"),
+            "overall_avg_repetition_penalty": _overall("avg_repetition_penalty"),
         },
     }
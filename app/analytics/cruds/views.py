@@ -0,0 +1,77 @@
+import logging
+import threading
+from typing import Optional
+from sqlalchemy import text
+
+from app.database import engine
+from app.analytics.models.views import ANALYTICS_VIEWS
+
+
+logger = logging.getLogger(__name__)
+
+# Bursts of inserts within this window collapse into a single refresh
+REFRESH_DELAY_SECONDS = 2.0
+
+_lock = threading.Lock()
+_pending: Optional[threading.Timer] = None
+# Bumped whenever view contents or underlying rows change in this process
+_generation = 0
+
+
+def views_generation() -> int:
+    """Return a counter that changes whenever analytics data may have changed."""
+    return _generation
+
+
+def mark_stale() -> None:
+    """Invalidate in-process analytics caches."""
+    global _generation
+    _generation += 1
+
+
+def refresh_analytics_views() -> None:
+    """Refresh materialized analytics views; plain views (non-Postgres) are always current."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for name in ANALYTICS_VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+    mark_stale()
+
+
+def _run_scheduled_refresh() -> None:
+    global _pending
+    with _lock:
+        _pending = None
+    try:
+        refresh_analytics_views()
+    except Exception:
+        logger.exception("Failed to refresh analytics views")
+
+
+def schedule_refresh() -> None:
+    """Debounced refresh: schedule one view refresh unless one is already pending."""
+    global _pending
+    mark_stale()
+    if engine.dialect.name != "postgresql":
+        return
+    with _lock:
+        if _pending is not None:
+            return
+        _pending = threading.Timer(REFRESH_DELAY_SECONDS, _run_scheduled_refresh)
+        _pending.daemon = True
+        _pending.start()
+
+
+def flush_pending_refresh() -> None:
+    """Run a pending debounced refresh now (on shutdown) so it is not lost with the daemon timer."""
+    global _pending
+    with _lock:
+        timer, _pending = _pending, None
+    if timer is None:
+        return
+    timer.cancel()
+    try:
+        refresh_analytics_views()
+    except Exception:
+        logger.exception("Failed to refresh analytics views on shutdown")
@@ -0,0 +1,7 @@
+from .views import ANALYTICS_VIEWS, EvalModelComparisonMV, EvalScatterMV
+
+__all__ = [
+	"ANALYTICS_VIEWS",
+	"EvalModelComparisonMV",
+	"EvalScatterMV",
+]
@@ -0,0 +1,56 @@
+from sqlalchemy import Column, Integer, String, Float
+
+from app.database import Base
+
+
+# View name -> (SELECT definition, unique key columns used for concurrent refresh)
+ANALYTICS_VIEWS = {
+    "mv_eval_scatter": (
+        "SELECT model, temperature, top_p,"
+        " AVG(lexical_diversity) AS avg_lexical_diversity,"
+        " AVG(query_coverage) AS avg_query_coverage,"
+        " AVG(flesch_kincaid_grade) AS avg_fk_grade,"
+        " AVG(repetition_penalty) AS avg_repetition_penalty,"
+        " COUNT(id) AS run_count"
+        " FROM evaluations GROUP BY model, temperature, top_p",
+        "model, temperature, top_p",
+    ),
+    "mv_eval_model_comparison": (
+        "SELECT model,"
+        " AVG(lexical_diversity) AS avg_lexical_diversity,"
+        " AVG(query_coverage) AS avg_query_coverage,"
+        " AVG(flesch_kincaid_grade) AS avg_fk_grade,"
+        " AVG(repetition_penalty) AS avg_repetition_penalty"
+        " FROM evaluations GROUP BY model",
+        "model",
+    ),
+}
+
+
+class EvalScatterMV(Base):
+    """Read-only mapping of per-(model, temperature, top_p) metric averages."""
+
+    __tablename__ = "mv_eval_scatter"
+    __table_args__ = {"info": {"is_view": True}}
+
+    model = Column(String, primary_key=True)
+    temperature = Column(Float, primary_key=True)
+    top_p = Column(Float, primary_key=True)
+    avg_lexical_diversity = Column(Float)
+    avg_query_coverage = Column(Float)
+    avg_fk_grade = Column(Float)
+    avg_repetition_penalty = Column(Float)
+    run_count = Column(Integer)
+
+
+class EvalModelComparisonMV(Base):
+    """Read-only mapping of per-model metric averages."""
+
+    __tablename__ = "mv_eval_model_comparison"
+    __table_args__ = {"info": {"is_view": True}}
+
+    model = Column(String, primary_key=True)
+    avg_lexical_diversity = Column(Float)
+    avg_query_coverage = Column(Float)
+    avg_fk_grade = Column(Float)
+    avg_repetition_penalty = Column(Float)
@@ -1,13 +1,56 @@
+import threading
+import time
 from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import engine, get_db
 from app.analytics.cruds.analytics import get_analytics as aggregate
+from app.analytics.cruds.views import views_generation
+from app.analytics.models.views import EvalScatterMV
+from app.evaluation.models.evaluation import Evaluation
 
 
 router = APIRouter()
 
+# Short TTL absorbs bursts of dashboard widgets without even probing the DB
+CACHE_TTL_SECONDS = 5.0
+
+_CACHE = {"version": None, "payload": None, "checked_at": 0.0}
+_CACHE_LOCK = threading.Lock()
+# The cache key must track what the payload is read from. Materialized views lag
+# behind inserts (and may be refreshed by another process), so on Postgres probe
+# the view itself (~25 rows); plain views are always current, so MAX(id) is exact
+# there and avoids re-aggregating the table just to probe.
+if engine.dialect.name == "postgresql":
+    _VERSION_STMT = select(func.sum(EvalScatterMV.run_count))
+else:
+    _VERSION_STMT = select(func.max(Evaluation.id))
+
 
 @router.get("/analytics")
 def get_analytics(db: Session = Depends(get_db)):
-    """Return aggregated analytics payload for dashboards."""
-    return aggregate(db)
+    """Return aggregated analytics payload for dashboards.
+
+    The payload is cached in-process and keyed by a cheap probe of the
+    analytics data (total runs in the materialized view on Postgres, MAX(id)
+    elsewhere), so repeat calls cost one small query until the data changes.
+    Within the TTL, the in-process generation counter is the only check.
+    """
+    now = time.monotonic()
+    generation = views_generation()
+    with _CACHE_LOCK:
+        cached_version = _CACHE["version"]
+        fresh = now - _CACHE["checked_at"] < CACHE_TTL_SECONDS
+        if cached_version is not None and cached_version[1] == generation and fresh:
+            return _CACHE["payload"]
+
+    version = (db.execute(_VERSION_STMT).scalar(), generation)
+    with _CACHE_LOCK:
+        if version == _CACHE["version"]:
+            _CACHE["checked_at"] = now
+            return _CACHE["payload"]
+
+    payload = aggregate(db)
+    with _CACHE_LOCK:
+        _CACHE.update(version=version, payload=payload, checked_at=now)
+    return payload
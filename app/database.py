@@ -8,9 +8,16 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./llm_evaluator.db")
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# Read-heavy analytics reissues the same statements: keep a larger compiled-SQL cache
+# and pre-ping pooled connections so stale ones are replaced transparently.
+engine_options = {"pool_pre_ping": True, "query_cache_size": 2000}
+if DATABASE_URL.startswith("sqlite"):
+    engine_options["connect_args"] = {"check_same_thread": False}
+else:
+    engine_options["pool_size"] = int(os.getenv("DB_POOL_SIZE", "10"))
+    engine_options["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+engine = create_engine(DATABASE_URL, **engine_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -1,6 +1,7 @@
-from .evaluation import create_evaluation, get_evaluations
+from .evaluation import create_evaluation, create_evaluations, get_evaluations
 
 __all__ = [
 	"create_evaluation",
+	"create_evaluations",
 	"get_evaluations",
 ]
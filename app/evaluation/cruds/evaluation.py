@@ -1,11 +1,22 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.evaluation.models.evaluation import Evaluation
 from app.evaluation.schemas.evaluation import EvaluationCreate
+from app.analytics.cruds.views import schedule_refresh
 
 
-def get_evaluations(db: Session, skip: int = 0, limit: int = 100):
-    """Return paginated evaluations."""
-    return db.query(Evaluation).offset(skip).limit(limit).all()
+def get_evaluations(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    """Return paginated evaluations.
+
+    - after_id: keyset pagination (rows with id > after_id, ordered by id); cost does not grow with page depth.
+    - skip: OFFSET pagination, kept for compatibility; deep offsets scan and discard rows.
+    """
+    query = db.query(Evaluation)
+    if after_id is not None:
+        query = query.filter(Evaluation.id > after_id).order_by(Evaluation.id)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 
 def create_evaluation(db: Session, evaluation: EvaluationCreate):
@@ -14,4 +25,17 @@ def create_evaluation(db: Session, evaluation: EvaluationCreate):
     db.add(db_row)
     db.commit()
     db.refresh(db_row)
+
+    schedule_refresh()
     return db_row
+
+
+def create_evaluations(db: Session, evaluations: list[EvaluationCreate]) -> int:
+    """Persist several evaluation rows in one transaction; return how many were stored."""
+    if not evaluations:
+        return 0
+    db.add_all([Evaluation(**evaluation.dict()) for evaluation in evaluations])
+    db.commit()
+
+    schedule_refresh()
+    return len(evaluations)
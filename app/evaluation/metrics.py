@@ -1,20 +1,41 @@
+import re
 from collections import Counter
+from functools import lru_cache
 from typing import Iterable
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+
+
+# Precompiled tokenizers: C regex scans instead of NLTK's Punkt pipeline
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z']*")
+# A run of . ! ? followed by whitespace/end of text ends a sentence, so decimals (3.14) do not split.
+# The lookbehind anchors each run at its start, keeping the scan linear on long punctuation runs.
+_SENT_END_RE = re.compile(r"(?<![.!?])[.!?]+(?=\s|$)")
+_VOWEL_RUN_RE = re.compile(r"[aeiouy]+")
+
+
+def _count_sentences(text: str) -> int:
+    """Count sentence terminators, plus one for trailing text after the last terminator."""
+    count = 0
+    last_end = 0
+    for match in _SENT_END_RE.finditer(text):
+        count += 1
+        last_end = match.end()
+    if text[last_end:].strip():
+        count += 1
+    return count
+
+
+@lru_cache(maxsize=None)
+def _stopwords() -> frozenset[str]:
+    """English stopwords, loaded once on first use (after startup downloads NLTK data)."""
+    return frozenset(stopwords.words("english"))
 
 
 def _count_syllables(word: str) -> int:
     """Heuristic syllable counter suitable for FK grade (no heavy deps)."""
     word = word.lower()
-    vowels = "aeiouy"
-    count = 0
-    prev_is_vowel = False
-    for ch in word:
-        is_vowel = ch in vowels
-        if is_vowel and not prev_is_vowel:
-            count += 1
-        prev_is_vowel = is_vowel
+    # Each run of consecutive vowels is one syllable
+    count = len(_VOWEL_RUN_RE.findall(word))
     # Silent 'e' adjustment
     if word.endswith("e") and count > 1:
         count -= 1
@@ -36,11 +57,9 @@ def _repetition_penalty(tokens: list[str]) -> float:
     def _ratio_for_n(n: int) -> float:
         if len(tokens) < n:
             return 0.0
-        ngrams = [tuple(tokens[i : i + n]) for i in range(len(tokens) - n + 1)]
-        total = len(ngrams)
-        if total == 0:
-            return 0.0
-        unique = len(set(ngrams))
+        total = len(tokens) - n + 1
+        # set() consumes the zip lazily: no intermediate n-gram list
+        unique = len(set(zip(*(tokens[i:] for i in range(n)))))
         repeats = total - unique
         return (repeats / total) * 100.0
 
@@ -55,9 +74,15 @@ def calculate_metrics(prompt: str, response: str) -> dict:
     """Compute objective metrics for a prompt-response pair.
 
     Returns a dict with: lexical_diversity, query_coverage, flesch_kincaid_grade, repetition_penalty.
+    Results are memoized per (prompt, response); each call gets its own dict copy.
     """
+    return dict(_calculate_metrics(prompt, response))
+
+
+@lru_cache(maxsize=2048)
+def _calculate_metrics(prompt: str, response: str) -> dict:
     text = (response or "")
-    tokens = word_tokenize(text.lower())
+    tokens = _WORD_RE.findall(text.lower())
     if not tokens:
         return {
             "lexical_diversity": 0.0,
@@ -66,22 +91,22 @@ def calculate_metrics(prompt: str, response: str) -> dict:
             "repetition_penalty": 0.0,
         }
 
+    # Type counts drive diversity, coverage and syllables: work scales with vocabulary, not length
+    counts = Counter(tokens)
+    num_words = len(tokens)
+
     # Unique types vs tokens as a percentage
-    lexical_diversity = (len(set(tokens)) / len(tokens)) * 100.0
+    lexical_diversity = (len(counts) / num_words) * 100.0
 
     # Coverage over prompt keywords (non-stopwords)
-    prompt_words = set(word_tokenize((prompt or "").lower()))
-    stop_words = set(stopwords.words("english"))
-    prompt_keywords = prompt_words - stop_words
-    response_words = set(tokens)
-    covered = prompt_keywords.intersection(response_words)
+    prompt_words = set(_WORD_RE.findall((prompt or "").lower()))
+    prompt_keywords = prompt_words - _stopwords()
+    covered = prompt_keywords & counts.keys()
     query_coverage = (len(covered) / len(prompt_keywords) * 100.0) if prompt_keywords else 100.0
 
     # Flesch-Kincaid Grade Level
-    sentences = sent_tokenize(text)
-    num_sentences = max(len(sentences), 1)
-    num_words = len(tokens)
-    num_syllables = sum(_count_syllables(w) for w in tokens)
+    num_sentences = max(_count_sentences(text), 1)
+    num_syllables = sum(_count_syllables(w) * c for w, c in counts.items())
     fk_grade = _flesch_kincaid_grade(num_sentences, num_words, num_syllables)
 
     # Repetition penalty with trigram-first, bigram fallback for short texts
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -9,12 +9,28 @@ class Evaluation(Base):
     """SQLAlchemy model for a single LLM evaluation run and its metrics."""
 
     __tablename__ = "evaluations"
+    __table_args__ = (
+        # Backs GROUP BY (model, temperature, top_p); on Postgres the metric
+        # columns are INCLUDEd so aggregation is an index-only scan.
+        Index(
+            "ix_eval_model_temp_topp",
+            "model",
+            "temperature",
+            "top_p",
+            postgresql_include=[
+                "lexical_diversity",
+                "query_coverage",
+                "flesch_kincaid_grade",
+                "repetition_penalty",
+            ],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     prompt = Column(String, nullable=False)
-    model = Column(String, nullable=False, index=True)
-    temperature = Column(Float, nullable=False, index=True)
-    top_p = Column(Float, nullable=False, index=True)
+    model = Column(String, nullable=False)
+    temperature = Column(Float, nullable=False)
+    top_p = Column(Float, nullable=False)
 
     # Objective metrics
     lexical_diversity = Column(Float, nullable=False)
@@ -1,27 +1,41 @@
 import asyncio
+import os
 import time
+from functools import lru_cache
 import google.generativeai as genai
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.evaluation.metrics import calculate_metrics
-from app.database import get_db
-from app.evaluation.cruds.evaluation import create_evaluation, get_evaluations as list_evaluations
+from app.database import SessionLocal, get_db
+from app.evaluation.cruds.evaluation import create_evaluations, get_evaluations as list_evaluations
 from app.evaluation.schemas.evaluation import Evaluation, EvaluationCreate
 from app.evaluation.schemas.prompt import PromptTest
 
 
 router = APIRouter()
 
+# Cap in-flight Gemini calls per process so large param grids don't trigger 429 cascades
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+_GEMINI_SEM = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+
+@lru_cache(maxsize=32)
+def _get_model(model_name: str) -> genai.GenerativeModel:
+    """Return a shared GenerativeModel per model name instead of building one per call."""
+    return genai.GenerativeModel(model_name)
+
 
 async def _call_google_ai(model_name: str, prompt: str, temp: float, top_p: float) -> dict:
     """Call Gemini with generation parameters and return output + computed metrics."""
     config = genai.types.GenerationConfig(temperature=temp, top_p=top_p)
-    model = genai.GenerativeModel(model_name)
+    model = _get_model(model_name)
 
     start = time.time()
     try:
-        resp = await model.generate_content_async(prompt, generation_config=config)
+        async with _GEMINI_SEM:
+            resp = await model.generate_content_async(prompt, generation_config=config)
         _ = time.time() - start  # latency captured if needed later
         text = resp.text
         metrics = calculate_metrics(prompt, text)
@@ -30,31 +44,56 @@ async def _call_google_ai(model_name: str, prompt: str, temp: float, top_p: floa
         return {"temperature": temp, "top_p": top_p, "output": None, "metrics": None, "error": f"An API error occurred: {e}"}
 
 
+def _persist_evaluations(evaluations: list[EvaluationCreate]) -> None:
+    """Store evaluations after the response is sent; uses its own session since the request's is closed."""
+    db = SessionLocal()
+    try:
+        create_evaluations(db, evaluations)
+    finally:
+        db.close()
+
+
 @router.post("/test-prompt")
-async def test_prompt(payload: PromptTest, db: Session = Depends(get_db)):
-    """Generate responses across supplied param pairs, compute metrics, persist, and return results."""
+async def test_prompt(payload: PromptTest, background_tasks: BackgroundTasks):
+    """Generate responses across supplied param pairs, compute metrics, and return results.
+
+    Results are persisted in a background task after the response ships.
+    """
     tasks = [
         _call_google_ai(payload.model, payload.prompt, pair.temperature, pair.top_p)
         for pair in payload.param_pairs
     ]
     results = await asyncio.gather(*tasks)
 
-    for r in results:
-        if r.get("metrics"):
-            create_evaluation(
-                db,
-                EvaluationCreate(
-                    prompt=payload.prompt,
-                    model=payload.model,
-                    temperature=r["temperature"],
-                    top_p=r["top_p"],
-                    **r["metrics"],
-                ),
+    # Single batched INSERT + commit, off the request's critical path
+    background_tasks.add_task(
+        _persist_evaluations,
+        [
+            EvaluationCreate(
+                prompt=payload.prompt,
+                model=payload.model,
+                temperature=r["temperature"],
+                top_p=r["top_p"],
+                **r["metrics"],
             )
+            for r in results
+            if r.get("metrics")
+        ],
+    )
     return results
 
 
 @router.get("/evaluations", response_model=list[Evaluation])
-def get_evaluations(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Paginated evaluations listing."""
-    return list_evaluations(db, skip=skip, limit=limit)
+def get_evaluations(
+    skip: int = Query(0, deprecated=True),
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """Paginated evaluations listing; pass the last seen id as after_id for keyset paging.
+
+    after_id and skip are mutually exclusive (400 if both are given).
+    """
+    if after_id is not None and skip:
+        raise HTTPException(status_code=400, detail="Use either after_id or skip, not both.")
+    return list_evaluations(db, skip=skip, limit=limit, after_id=after_id)
@@ -1,12 +1,15 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 from dotenv import load_dotenv
 import google.generativeai as genai
 
 from app.database import engine
 from app.router import router as api_router
-from app.startup import download_nltk_data, populate_db_from_csv
+from app.startup import download_nltk_data, create_tables, create_analytics_views, populate_db_from_csv
+from app.analytics.cruds.views import flush_pending_refresh, refresh_analytics_views
 from app.evaluation.models.evaluation import Evaluation  # ensure model is registered
 from app.evaluation.models import evaluation as _  # noqa: F401 (import side-effect)
 
@@ -22,12 +25,23 @@ genai.configure(api_key=api_key)
 # Ensure NLTK resources and seed data
 download_nltk_data()
 
-# Create tables and optionally seed from CSV
-from app.database import Base  # local import to avoid cycles
-Base.metadata.create_all(bind=engine)
+# Create tables and analytics views, optionally seed from CSV
+create_tables(engine)
+create_analytics_views(engine)
 populate_db_from_csv(Evaluation)
+# Always refresh on startup: also recovers a debounced refresh lost when a previous process was killed
+refresh_analytics_views()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Don't drop a debounced materialized-view refresh on graceful shutdown
+    flush_pending_refresh()
+
+
+# orjson serializes the float-heavy analytics payloads in C
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS: allow any origin/method/header for demo/analytics usage
 app.add_middleware(
@@ -1,12 +1,19 @@
 import csv
 import os
 import logging
+from itertools import islice
 import nltk
 from typing import Iterable, Optional
-from app.database import SessionLocal
+from sqlalchemy import text
+from app.database import Base, SessionLocal
+from app.analytics.models.views import ANALYTICS_VIEWS
 
 
-def download_nltk_data(packages: Iterable[str] = ("punkt", "stopwords", "punkt_tab")) -> None:
+# Rows per bulk INSERT when seeding; caps memory for large CSVs
+SEED_BATCH_SIZE = 5000
+
+
+def download_nltk_data(packages: Iterable[str] = ("stopwords",)) -> None:
     """Ensure NLTK data is present; download if missing for required packages."""
     for package in packages:
         try:
@@ -18,11 +25,40 @@ def download_nltk_data(packages: Iterable[str] = ("punkt", "stopwords", "punkt_t
                 nltk.download(package)
 
 
+def create_tables(engine) -> None:
+    """Create ORM tables and their indexes, skipping read-only mappings that are backed by views.
+
+    Indexes are also created on pre-existing tables, since create_all only adds them with new tables.
+    """
+    tables = [t for t in Base.metadata.sorted_tables if not t.info.get("is_view")]
+    Base.metadata.create_all(bind=engine, tables=tables)
+    for table in tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def create_analytics_views(engine) -> None:
+    """Create analytics aggregate views if missing; idempotent on startup.
+
+    - PostgreSQL: materialized views plus a unique index so they can be refreshed CONCURRENTLY.
+    - Other backends (SQLite): plain views, which are always current.
+    """
+    materialized = engine.dialect.name == "postgresql"
+    with engine.begin() as conn:
+        for name, (definition, key) in ANALYTICS_VIEWS.items():
+            if materialized:
+                conn.execute(text(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {definition}"))
+                conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{name} ON {name} ({key})"))
+            else:
+                conn.execute(text(f"CREATE VIEW IF NOT EXISTS {name} AS {definition}"))
+
+
 def populate_db_from_csv(model_cls, csv_path: Optional[str] = None) -> None:
     """Populate evaluations table from CSV if empty; idempotent on startup.
 
     - Pass SEED_CSV_PATH env var to override path; default "mock_data.csv" at project root.
     - Expects CSV columns: prompt, model, temperature, top_p, lexical_diversity, query_coverage, flesch_kincaid_grade, repetition_penalty.
+    - Rows are bulk-inserted as plain mappings in batches of SEED_BATCH_SIZE (no per-row ORM objects).
     """
     logger = logging.getLogger(__name__)
     if csv_path is None:
@@ -34,26 +70,28 @@ def populate_db_from_csv(model_cls, csv_path: Optional[str] = None) -> None:
             logger.info("Database already populated; skipping CSV seed.")
             return
         try:
-            with open(csv_path, "r", newline="", encoding="utf-8") as f:
+            with open(csv_path, "r", newline="", encoding="utf-8", buffering=1 << 20) as f:
                 reader = csv.DictReader(f)
-                batch = []
-                for row in reader:
-                    batch.append(
-                        model_cls(
-                            prompt=row["prompt"],
-                            model=row["model"],
-                            temperature=float(row["temperature"]),
-                            top_p=float(row["top_p"]),
-                            lexical_diversity=float(row["lexical_diversity"]),
-                            query_coverage=float(row["query_coverage"]),
-                            flesch_kincaid_grade=float(row["flesch_kincaid_grade"]),
-                            repetition_penalty=float(row["repetition_penalty"]),
-                        )
-                    )
-                if batch:
-                    db.add_all(batch)
+                rows = (
+                    {
+                        "prompt": row["prompt"],
+                        "model": row["model"],
+                        "temperature": float(row["temperature"]),
+                        "top_p": float(row["top_p"]),
+                        "lexical_diversity": float(row["lexical_diversity"]),
+                        "query_coverage": float(row["query_coverage"]),
+                        "flesch_kincaid_grade": float(row["flesch_kincaid_grade"]),
+                        "repetition_penalty": float(row["repetition_penalty"]),
+                    }
+                    for row in reader
+                )
+                total = 0
+                while batch := list(islice(rows, SEED_BATCH_SIZE)):
+                    db.bulk_insert_mappings(model_cls, batch)
+                    total += len(batch)
+                if total:
                     db.commit()
-                    logger.info("Seeded %d rows from %s", len(batch), csv_path)
+                    logger.info("Seeded %d rows from %s", total, csv_path)
                 else:
                     logger.info("No rows found in %s; nothing to seed.", csv_path)
         except FileNotFoundError:
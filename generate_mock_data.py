@@ -1,11 +1,11 @@
 import csv
 import math
 import random
+import re
 from typing import List, Optional
 from datasets import load_dataset
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
 from tqdm import tqdm
 
 # --- NLTK Setup ---
@@ -14,14 +14,27 @@ try:
     stopwords.words('english')
 except LookupError:
     nltk.download('stopwords')
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
+
+# Same regex tokenizers as app/evaluation/metrics.py
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z']*")
+# A run of . ! ? followed by whitespace/end of text ends a sentence, so decimals (3.14) do not split.
+# The lookbehind anchors each run at its start, keeping the scan linear on long punctuation runs.
+_SENT_END_RE = re.compile(r"(?<![.!?])[.!?]+(?=\s|$)")
+_VOWEL_RUN_RE = re.compile(r"[aeiouy]+")
+_STOPWORDS = frozenset(stopwords.words('english'))
+
+
+def _count_sentences(text: str) -> int:
+    """Count sentence terminators, plus one for trailing text after the last terminator."""
+    count = 0
+    last_end = 0
+    for match in _SENT_END_RE.finditer(text):
+        count += 1
+        last_end = match.end()
+    if text[last_end:].strip():
+        count += 1
+    return count
+
 
 # --- Metrics Calculation ---
 def calculate_metrics(prompt: str, response: str):
@@ -31,7 +44,7 @@ def calculate_metrics(prompt: str, response: str):
     response = str(response)
 
     # Tokenize the response
-    words = word_tokenize(response.lower())
+    words = _WORD_RE.findall(response.lower())
     if not words:
         return {
             "lexical_diversity": 0.0,
@@ -44,16 +57,15 @@ def calculate_metrics(prompt: str, response: str):
     lexical_diversity = (len(set(words)) / len(words)) * 100 if words else 0
 
     # 2. Query Coverage
-    prompt_words = set(word_tokenize(prompt.lower()))
-    stop_words = set(stopwords.words('english'))
-    prompt_keywords = prompt_words - stop_words
+    prompt_words = set(_WORD_RE.findall(prompt.lower()))
+    prompt_keywords = prompt_words - _STOPWORDS
     response_words = set(words)
     
     covered_keywords = prompt_keywords.intersection(response_words)
     query_coverage = (len(covered_keywords) / len(prompt_keywords)) * 100 if prompt_keywords else 100
 
     # 3. Structural Depth (Sentence Count)
-    sentence_count = len(sent_tokenize(response))
+    sentence_count = _count_sentences(response)
 
     # 4. Complexity Proxy (Average Word Length)
     total_chars = sum(len(word) for word in words)
@@ -62,14 +74,7 @@ def calculate_metrics(prompt: str, response: str):
     # Reuse logic from app/evaluation/metrics.py: FK grade and repetition penalty
     def _count_syllables(word: str) -> int:
         word = word.lower()
-        vowels = "aeiouy"
-        count = 0
-        prev = False
-        for ch in word:
-            is_vowel = ch in vowels
-            if is_vowel and not prev:
-                count += 1
-            prev = is_vowel
+        count = len(_VOWEL_RUN_RE.findall(word))
         if word.endswith("e") and count > 1:
             count -= 1
         return max(count, 1)
@@ -82,13 +87,12 @@ def calculate_metrics(prompt: str, response: str):
     def _repetition_penalty(tokens: list[str], n: int = 3) -> float:
         if len(tokens) < n:
             return 0.0
-        ngrams = [tuple(tokens[i:i+n]) for i in range(len(tokens)-n+1)]
-        total = len(ngrams)
-        unique = len(set(ngrams))
+        total = len(tokens) - n + 1
+        unique = len(set(zip(*(tokens[i:] for i in range(n)))))
         repeats = total - unique
-        return (repeats/total)*100.0 if total > 0 else 0.0
+        return (repeats/total)*100.0
 
-    num_sentences = max(len(sent_tokenize(response)), 1)
+    num_sentences = max(_count_sentences(response), 1)
     num_words = len(words)
     num_syllables = sum(_count_syllables(w) for w in words)
     fk_grade = _flesch_kincaid_grade(num_sentences, num_words, num_syllables)